@@ -5,25 +5,82 @@ JSON file for use by the static news site. It fetches each feed, parses
 the XML, extracts basic fields and deduplicates entries based on the
 headline. The resulting structure is written to ``data/news.json``.
 
-The script is intentionally kept lightweight and uses only Python's
-standard library to avoid external dependencies. It should be run as part
-of a scheduled job (e.g. GitHub Action) to refresh the site contents every
-10 minutes. If any feeds fail to load or parse, the script will skip them
-gracefully and continue processing the remaining feeds.
+The script is intentionally kept lightweight and runs on Python's standard
+library alone. The following optional packages are used when installed:
+
+* ``lxml`` parses feeds faster than :mod:`xml.etree.ElementTree` and
+  tolerates malformed XML;
+* ``orjson`` writes the output faster than :mod:`json`;
+* ``pycurl`` downloads all feeds from a single thread with libcurl's multi
+  interface;
+* otherwise ``httpx`` downloads feeds through one pooled client, reusing
+  connections to hosts that serve several feeds (over HTTP/2 when ``h2`` is
+  available);
+* ``selectolax`` (lexbor backend) finds images in description HTML.
+
+It should be run as part of a scheduled job (e.g. GitHub Action) to refresh
+the site contents every 10 minutes. If any feeds fail to load or parse, the
+script will skip them gracefully and continue processing the remaining
+feeds.
 """
 
 import json
-import xml.etree.ElementTree as ET
 import urllib.request
 import urllib.error
+import http.client
 import datetime
 import email.utils
+import functools
+import gzip
+import hashlib
+import heapq
 import html
+import html.entities
+import io
 import os
+import pickle
 import concurrent.futures
 import re
+import sys
+import zlib
+from typing import Any, Iterator, Optional, Protocol
 from urllib.parse import urlparse
 
+try:
+    from lxml import etree as ET
+    from lxml import html as lxml_html
+    HAVE_LXML = True
+except ImportError:  # pragma: no cover - depends on the environment
+    import xml.etree.ElementTree as ET
+    HAVE_LXML = False
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    httpx = None  # type: ignore[assignment]
+
+try:
+    import pycurl
+except ImportError:  # pragma: no cover - depends on the environment
+    pycurl = None  # type: ignore[assignment]
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - depends on the environment
+    LexborHTMLParser = None  # type: ignore[assignment,misc]
+
+
+class _Headers(Protocol):
+    """Response headers with case-insensitive lookup, as provided by
+    :class:`http.client.HTTPMessage` and ``httpx.Headers``."""
+
+    def get(self, name: str, /) -> Optional[str]: ...
+
 
 # Simple bias mapping by news domain. Values range from -1 (left) to +1 (right)
 # with 0 representing a centrist or unknown leaning.
@@ -36,13 +93,54 @@ BIAS_RATINGS = {
     'news.google.com': 0,
 }
 
-def parse_pub_date(value: str) -> datetime.datetime:
-    """Parse an RSS/Atom pubDate into a timezone‑aware UTC datetime.
+# Namespaced tags looked up for every feed entry, plus the pattern used to
+# fish an image out of description HTML, built once at import.
+_ATOM = '{http://www.w3.org/2005/Atom}'
+_MRSS = '{http://search.yahoo.com/mrss/}'
+_ATOM_ENTRY = _ATOM + 'entry'
+_ATOM_TITLE = _ATOM + 'title'
+_ATOM_PUBLISHED = _ATOM + 'published'
+_MRSS_CONTENT = _MRSS + 'content'
+_MRSS_THUMBNAIL = _MRSS + 'thumbnail'
+_ENTRY_TAGS = ('item', _ATOM_ENTRY)
+_IMG_RE = re.compile(r'''<img[^>]+src=["']([^"']+)["']''')
+_TAG_RE = re.compile(r'<[^>]+>')
 
-    Falls back to the current UTC time if parsing fails.
+# HTML5 named entities (``nbsp`` -> U+00A0, ...), which XML parsers do not
+# know. Only used to build ``_NUMERIC_REFS`` below.
+_HTML5_ENTITIES = {
+    name[:-1]: value for name, value in html.entities.html5.items() if name.endswith(';')
+}
+
+# The same entities as numeric character references, which every XML parser
+# understands. Feeds often use HTML entities without declaring them; lxml's
+# recovery mode would otherwise silently truncate the surrounding text.
+# The five predefined XML entities are excluded by the pattern itself, so the
+# many ``&lt;``/``&amp;`` of escaped description HTML never reach Python.
+_ENTITY_REF_RE = re.compile(rb'&(?!(?:amp|lt|gt|quot|apos);)([A-Za-z][A-Za-z0-9]*);')
+_NUMERIC_REFS = {
+    name.encode('ascii'): ''.join(f'&#{ord(char)};' for char in value).encode('ascii')
+    for name, value in _HTML5_ENTITIES.items()
+}
+
+# Network timeouts in seconds. A feed host that cannot even accept a
+# connection is given up on quickly, while a slow but responsive server is
+# allowed longer to stream the feed body.
+CONNECT_TIMEOUT = 5
+READ_TIMEOUT = 15
+
+# Upper bound on concurrent feed fetches. Every feed is fetched by one shared
+# pool, so this caps the number of worker threads regardless of feeds.json.
+MAX_WORKERS = 64
+
+
+@functools.lru_cache(maxsize=8192)
+def _parse_date(value: str) -> Optional[datetime.datetime]:
+    """Parse a non-empty pubDate string, returning ``None`` on failure.
+
+    Feeds often repeat the same timestamp across items, so results are
+    memoized by the raw string.
     """
-    if not value:
-        return datetime.datetime.now(datetime.timezone.utc)
     try:
         # ``email.utils.parsedate_to_datetime`` returns a :class:`datetime`
         # object and handles many RSS/Atom date formats. It may produce a
@@ -55,14 +153,96 @@ def parse_pub_date(value: str) -> datetime.datetime:
             dt = dt.astimezone(datetime.timezone.utc)
         return dt
     except Exception:
+        return None
+
+
+def parse_pub_date(value: str) -> datetime.datetime:
+    """Parse an RSS/Atom pubDate into a timezone‑aware UTC datetime.
+
+    Falls back to the current UTC time if parsing fails.
+    """
+    dt = _parse_date(value) if value else None
+    if dt is None:
+        # Not cached, so a missing date always means "now"
         return datetime.datetime.now(datetime.timezone.utc)
+    return dt
 
 
-def _html_parser() -> ET.XMLParser:
-    parser = ET.XMLParser()
-    for name, value in html.entities.html5.items():
-        parser.entity[name[:-1]] = value
-    return parser
+def _title_fingerprint(title: str) -> int:
+    """Return a 64-bit fingerprint of a normalised headline for deduplication."""
+    digest = hashlib.blake2b(title.strip().lower().encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def _strip_tags(fragment: str) -> str:
+    """Return the plain text of an HTML fragment such as an item description,
+    with HTML entities decoded."""
+    if not fragment:
+        return ''
+    if HAVE_LXML:
+        try:
+            return lxml_html.fragment_fromstring(fragment, create_parent='div').text_content()
+        except Exception:
+            # lxml rejects some fragments (whole documents, bare doctypes)
+            # with AssertionError or ParserError; use the regex instead
+            pass
+    # Descriptions are often not well-formed XML, so rather than parsing them
+    # just drop anything that looks like a tag
+    return html.unescape(_TAG_RE.sub('', fragment))
+
+
+def _find_image(description: str) -> str:
+    """Return the ``src`` of the first ``<img>`` in description HTML."""
+    # Cheap literal scan first; most descriptions have no <img> and never
+    # need a real parser or the regex engine
+    pos = description.find('<img')
+    if pos < 0:
+        return ''
+    if LexborHTMLParser is not None:
+        img = LexborHTMLParser(description).css_first('img[src]')
+        return (img.attributes.get('src') or '') if img is not None else ''
+    match = _IMG_RE.search(description, pos)
+    return match.group(1) if match else ''
+
+
+def _replace_entity(match: re.Match) -> bytes:
+    name = match.group(1)
+    # Unknown names are kept as literal text rather than left undeclared
+    return _NUMERIC_REFS.get(name) or b'&amp;' + name + b';'
+
+
+def _numeric_entities(xml_data: bytes) -> bytes:
+    """Replace HTML named entity references with numeric ones."""
+    if b'&' not in xml_data:
+        return xml_data
+    return _ENTITY_REF_RE.sub(_replace_entity, xml_data)
+
+
+def _iter_entries(xml_data: bytes) -> Iterator[Any]:
+    """Yield RSS ``item`` and Atom ``entry`` elements as they are parsed.
+
+    The feed is parsed incrementally and every element is released once the
+    caller has moved on to the next one, so the whole document tree is never
+    held in memory.
+    """
+    source = io.BytesIO(_numeric_entities(xml_data))
+    if HAVE_LXML:
+        # ``recover`` lets libxml2 salvage slightly malformed feeds instead of
+        # rejecting them outright. Entities are left unresolved so a feed
+        # cannot make us read local files or the network.
+        for _, elem in ET.iterparse(
+            source, events=('end',), tag=_ENTRY_TAGS,
+            recover=True, resolve_entities=False, no_network=True, huge_tree=False,
+        ):
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+    else:
+        for _, elem in ET.iterparse(source, events=('end',)):
+            if elem.tag in _ENTRY_TAGS:
+                yield elem
+                elem.clear()
 
 
 def extract_items(xml_data: bytes) -> list:
@@ -73,137 +253,406 @@ def extract_items(xml_data: bytes) -> list:
     from the link's domain.
     """
     items = []
+    # Bind hot globals to locals for the per-item loop
+    _unescape = html.unescape
+    _urlparse = urlparse
+    _intern = sys.intern
+    try:
+        for elem in _iter_entries(xml_data):
+            title = elem.findtext('title') or elem.findtext(_ATOM_TITLE) or ''
+            link = elem.findtext('link') or ''
+            # Atom may put link under <link href="..."/>
+            if not link:
+                link_elem = elem.find('link')
+                if link_elem is not None:
+                    link = link_elem.attrib.get('href', '')
+            description = elem.findtext('description') or elem.findtext('summary') or ''
+            # Remove HTML tags from description
+            description_text = _strip_tags(description)
+
+            # Attempt to extract an image URL from common RSS/Atom fields
+            image_url = ''
+            media = elem.find(_MRSS_CONTENT)
+            if media is not None:
+                image_url = media.attrib.get('url', '')
+            if not image_url:
+                enclosure = elem.find('enclosure')
+                if enclosure is not None and enclosure.attrib.get('type', '').startswith('image'):
+                    image_url = enclosure.attrib.get('url', '')
+            if not image_url:
+                thumb = elem.find(_MRSS_THUMBNAIL)
+                if thumb is not None:
+                    image_url = thumb.attrib.get('url', '')
+            if not image_url:
+                img_tag = elem.find('imageurl')
+                if img_tag is not None:
+                    image_url = img_tag.text or ''
+            if not image_url and description:
+                image_url = _find_image(description)
+
+            pub = elem.findtext('pubDate') or elem.findtext(_ATOM_PUBLISHED) or ''
+            pub_date = parse_pub_date(pub)
+            netloc = _urlparse(link).netloc
+            # Only a handful of distinct sources exist, so share one string
+            # per domain across all items
+            source = _intern(netloc.replace('www.', '')) if netloc else ''
+            bias = BIAS_RATINGS.get(source, 0)
+            items.append({
+                'title': _unescape(title.strip()),
+                'link': link.strip(),
+                'description': description_text.strip(),
+                'pubDate': pub_date.isoformat().replace('+00:00', 'Z'),
+                'source': source,
+                'image': image_url,
+                'bias': bias
+            })
+    except (ET.ParseError, ValueError):
+        # Keep the items parsed before the feed turned out to be malformed
+        pass
+    return items
+
+
+class _HTTPConnection(http.client.HTTPConnection):
+    """HTTP connection that connects with ``CONNECT_TIMEOUT`` and then reads
+    with ``READ_TIMEOUT``."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs['timeout'] = CONNECT_TIMEOUT
+        super().__init__(*args, **kwargs)
+
+    def connect(self) -> None:
+        super().connect()
+        self.sock.settimeout(READ_TIMEOUT)
+
+
+class _HTTPSConnection(http.client.HTTPSConnection):
+    """HTTPS counterpart of :class:`_HTTPConnection`. The TLS handshake is
+    part of connecting and therefore bound by ``CONNECT_TIMEOUT``."""
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        kwargs['timeout'] = CONNECT_TIMEOUT
+        super().__init__(*args, **kwargs)
+
+    def connect(self) -> None:
+        super().connect()
+        self.sock.settimeout(READ_TIMEOUT)
+
+
+class _HTTPHandler(urllib.request.HTTPHandler):
+    def http_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self.do_open(_HTTPConnection, req)
+
+
+class _HTTPSHandler(urllib.request.HTTPSHandler):
+    def https_open(self, req: urllib.request.Request) -> http.client.HTTPResponse:
+        return self.do_open(_HTTPSConnection, req, context=self._context)  # type: ignore[attr-defined]
+
+
+_opener = urllib.request.build_opener(_HTTPHandler, _HTTPSHandler)
+
+
+def make_http_client() -> Optional['httpx.Client']:
+    """Return a pooled ``httpx.Client`` shared by all fetches, or ``None``
+    when httpx is not installed and plain urllib should be used instead."""
+    if httpx is None:
+        return None
+    options: dict[str, Any] = dict(
+        follow_redirects=True,
+        timeout=httpx.Timeout(READ_TIMEOUT, connect=CONNECT_TIMEOUT),
+        limits=httpx.Limits(max_connections=MAX_WORKERS, max_keepalive_connections=32),
+    )
     try:
-        root = ET.fromstring(xml_data, parser=_html_parser())
-    except ET.ParseError:
-        return items
-
-    # RSS feeds typically have channel/item; Atom uses entry
-    # Try both patterns
-    rss_items = root.findall('.//item')
-    atom_items = root.findall('.//{http://www.w3.org/2005/Atom}entry')
-    for elem in rss_items + atom_items:
-        title = elem.findtext('title') or elem.findtext('{http://www.w3.org/2005/Atom}title') or ''
-        link = elem.findtext('link') or ''
-        # Atom may put link under <link href="..."/>
-        if not link:
-            link_elem = elem.find('link')
-            if link_elem is not None:
-                link = link_elem.attrib.get('href', '')
-        description = elem.findtext('description') or elem.findtext('summary') or ''
-        # Remove HTML tags from description
+        return httpx.Client(http2=True, **options)
+    except ImportError:
+        # HTTP/2 support needs the optional ``h2`` package
+        return httpx.Client(**options)
+
+
+def _decompress(data: bytes, encoding: Optional[str]) -> bytes:
+    """Undo a gzip or deflate ``Content-Encoding`` applied to ``data``."""
+    encoding = (encoding or '').strip().lower()
+    if encoding in ('gzip', 'x-gzip'):
+        return gzip.decompress(data)
+    if encoding == 'deflate':
         try:
-            description_text = ET.fromstring(f'<div>{description}</div>', parser=_html_parser()).text or ''
-        except ET.ParseError:
-            description_text = ''
-
-        # Attempt to extract an image URL from common RSS/Atom fields
-        image_url = ''
-        media = elem.find('{http://search.yahoo.com/mrss/}content')
-        if media is not None:
-            image_url = media.attrib.get('url', '')
-        if not image_url:
-            enclosure = elem.find('enclosure')
-            if enclosure is not None and enclosure.attrib.get('type', '').startswith('image'):
-                image_url = enclosure.attrib.get('url', '')
-        if not image_url:
-            thumb = elem.find('{http://search.yahoo.com/mrss/}thumbnail')
-            if thumb is not None:
-                image_url = thumb.attrib.get('url', '')
-        if not image_url:
-            img_tag = elem.find('imageurl')
-            if img_tag is not None:
-                image_url = img_tag.text or ''
-        if not image_url and description:
-            match = re.search(r'<img[^>]+src="([^"]+)"', description)
-            if not match:
-                match = re.search(r"<img[^>]+src='([^']+)'", description)
-            if match:
-                image_url = match.group(1)
-
-        pub = elem.findtext('pubDate') or elem.findtext('{http://www.w3.org/2005/Atom}published') or ''
-        pub_date = parse_pub_date(pub)
-        netloc = urlparse(link).netloc
-        source = netloc.replace('www.', '') if netloc else ''
-        bias = BIAS_RATINGS.get(source, 0)
-        items.append({
-            'title': html.unescape(title.strip()),
-            'link': link.strip(),
-            'description': html.unescape(description_text.strip()),
-            'pubDate': pub_date.isoformat().replace('+00:00', 'Z'),
-            'source': source,
-            'image': image_url,
-            'bias': bias
-        })
+            return zlib.decompress(data)
+        except zlib.error:
+            # Some servers send a raw deflate stream without the zlib header
+            return zlib.decompress(data, -zlib.MAX_WBITS)
+    return data
+
+
+def _download(url: str, headers: dict, client: Optional['httpx.Client'] = None) -> tuple[int, _Headers, bytes]:
+    """GET ``url`` and return ``(status, response headers, body)``.
+
+    The body is always returned decompressed.
+    """
+    if client is not None:
+        # httpx negotiates and decodes compression itself
+        response = client.get(url, headers=headers)
+        return response.status_code, response.headers, response.content
+    req = urllib.request.Request(url, headers={**headers, 'Accept-Encoding': 'gzip, deflate'})
+    try:
+        with _opener.open(req) as response:
+            data = _decompress(response.read(), response.headers.get('Content-Encoding'))
+            return response.status, response.headers, data
+    except urllib.error.HTTPError as err:
+        return err.code, err.headers, b''
+
+
+def _request_headers(entry: Optional[dict] = None) -> dict:
+    """Return the request headers for a feed, made conditional on the
+    ETag/Last-Modified of its cache ``entry`` when there is one."""
+    headers = {'User-Agent': 'Mozilla/5.0 (compatible; DailyUnbiasedNews/1.0)'}
+    if entry:
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('lastmod'):
+            headers['If-Modified-Since'] = entry['lastmod']
+    return headers
+
+
+def _handle_response(url: str, status: int, response_headers: _Headers, data: bytes, cache: Optional[dict] = None) -> list:
+    """Turn a downloaded feed into items, going through ``cache`` if given."""
+    entry = cache.get(url) if cache is not None else None
+    if status == 304 and entry:
+        return entry['items']
+    if not 200 <= status < 300:
+        return []
+    items = extract_items(data)
+    etag = response_headers.get('etag')
+    lastmod = response_headers.get('last-modified')
+    if cache is not None:
+        if etag or lastmod:
+            cache[url] = {'etag': etag, 'lastmod': lastmod, 'items': items}
+        else:
+            # Nothing to revalidate against; forget the previous response
+            cache.pop(url, None)
     return items
 
 
-def fetch_feed(url: str) -> list:
-    """Fetch and parse a single RSS/Atom feed URL, returning items list."""
+def fetch_feed(url: str, cache: Optional[dict] = None, client: Optional['httpx.Client'] = None) -> list:
+    """Fetch and parse a single RSS/Atom feed URL, returning items list.
+
+    When ``cache`` is given, the ETag and Last-Modified values stored for
+    ``url`` are sent as a conditional request. If the server answers 304 Not
+    Modified the cached items are returned without downloading the feed
+    again; otherwise the entry is refreshed from the new response. The feed
+    is downloaded through ``client`` when one is given (see
+    :func:`make_http_client`), and with urllib otherwise.
+    """
+    headers = _request_headers(cache.get(url) if cache is not None else None)
     try:
-        req = urllib.request.Request(url, headers={'User-Agent': 'Mozilla/5.0 (compatible; DailyUnbiasedNews/1.0)'})
-        with urllib.request.urlopen(req, timeout=20) as response:
-            data = response.read()
-            return extract_items(data)
+        status, response_headers, data = _download(url, headers, client)
+        return _handle_response(url, status, response_headers, data, cache)
     except Exception:
         # Return an empty list if any error occurs so other feeds continue processing
         return []
 
 
-def main():
+def _fetch_all_curl(urls: list, cache: dict) -> dict:
+    """Fetch ``urls`` from a single thread with libcurl's multi interface.
+
+    libcurl drives every transfer's socket itself, resolving, connecting and
+    downloading all feeds concurrently, and multiplexes feeds sharing a host
+    over one HTTP/2 connection where the server allows it. Each feed is
+    parsed as soon as its transfer completes.
+    """
+    results = {}
+    multi = pycurl.CurlMulti()
+    multi.setopt(pycurl.M_PIPELINING, pycurl.PIPE_MULTIPLEX)
+    transfers = {}
+    for url in urls:
+        curl = pycurl.Curl()
+        body = io.BytesIO()
+        # Headers of the final response; a redirect starts a new block
+        response_headers = http.client.HTTPMessage()
+
+        def on_header(raw: bytes, response_headers: http.client.HTTPMessage = response_headers) -> None:
+            line = raw.decode('iso-8859-1')
+            if line.startswith('HTTP/'):
+                for name in set(response_headers.keys()):
+                    del response_headers[name]
+            elif ':' in line:
+                name, value = line.split(':', 1)
+                response_headers[name.strip()] = value.strip()
+
+        headers = _request_headers(cache.get(url))
+        curl.setopt(pycurl.URL, url)
+        curl.setopt(pycurl.HTTPHEADER, [f'{name}: {value}' for name, value in headers.items()])
+        # Empty string: offer every encoding libcurl supports and decode it
+        curl.setopt(pycurl.ACCEPT_ENCODING, '')
+        curl.setopt(pycurl.FOLLOWLOCATION, True)
+        curl.setopt(pycurl.MAXREDIRS, 10)
+        curl.setopt(pycurl.CONNECTTIMEOUT, CONNECT_TIMEOUT)
+        # Give up on a transfer that stalls for READ_TIMEOUT seconds
+        curl.setopt(pycurl.LOW_SPEED_LIMIT, 1)
+        curl.setopt(pycurl.LOW_SPEED_TIME, READ_TIMEOUT)
+        curl.setopt(pycurl.NOSIGNAL, True)
+        curl.setopt(pycurl.WRITEDATA, body)
+        curl.setopt(pycurl.HEADERFUNCTION, on_header)
+        multi.add_handle(curl)
+        transfers[curl] = (url, body, response_headers)
+
+    try:
+        active = len(transfers)
+        while active:
+            ret, active = multi.perform()
+            if ret == pycurl.E_CALL_MULTI_PERFORM:
+                continue
+            while True:
+                queued, done, failed = multi.info_read()
+                for curl in done:
+                    url, body, response_headers = transfers[curl]
+                    status = curl.getinfo(pycurl.RESPONSE_CODE)
+                    try:
+                        results[url] = _handle_response(url, status, response_headers, body.getvalue(), cache)
+                    except Exception:
+                        # Isolate a feed that fails to parse, as fetch_feed does
+                        results[url] = []
+                for curl, _errno, _message in failed:
+                    # Skip failed feeds so the others continue processing
+                    results[transfers[curl][0]] = []
+                if not queued:
+                    break
+            if active:
+                multi.select(1.0)
+    finally:
+        for curl in transfers:
+            multi.remove_handle(curl)
+            curl.close()
+        multi.close()
+    return results
+
+
+def fetch_all(urls: list, cache: dict) -> dict:
+    """Fetch and parse every feed URL concurrently, returning ``{url: items}``.
+
+    All feeds, whatever their category, are fetched together so a slow feed
+    does not hold up the others. With pycurl installed this is done by
+    :func:`_fetch_all_curl`; otherwise :func:`fetch_feed` runs for each URL
+    on one shared thread pool.
+    """
+    urls = list(dict.fromkeys(urls))
+    if not urls:
+        return {}
+    if pycurl is not None:
+        return _fetch_all_curl(urls, cache)
+    results = {}
+    client = make_http_client()
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(urls))) as executor:
+            futures = {executor.submit(fetch_feed, url, cache, client): url for url in urls}
+            for future in concurrent.futures.as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception:
+                    results[futures[future]] = []
+    finally:
+        if client is not None:
+            client.close()
+    return results
+
+
+def load_feed_cache(path: str) -> dict:
+    """Load the per-URL conditional request cache, or an empty one.
+
+    The cache is internal state written only by :func:`save_feed_cache`, so
+    it is pickled rather than stored as JSON like the published output.
+    """
+    try:
+        with open(path, 'rb') as f:
+            return pickle.load(f)
+    except Exception:
+        # Missing, truncated or incompatible cache; start from scratch
+        return {}
+
+
+def save_feed_cache(cache: dict, path: str) -> None:
+    _write_atomic(path, pickle.dumps(cache, protocol=pickle.HIGHEST_PROTOCOL))
+
+
+def _write_atomic(path: str, data: bytes) -> None:
+    """Replace ``path`` with ``data`` so readers never see a partial file."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'wb') as out:
+        out.write(data)
+    os.replace(tmp_path, path)
+
+
+def write_json(obj: object, path: str) -> None:
+    """Atomically write ``obj`` to ``path`` as indented UTF-8 JSON."""
+    if orjson is not None:
+        data = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    else:
+        data = json.dumps(obj, ensure_ascii=False, indent=2).encode('utf-8')
+    _write_atomic(path, data)
+
+
+def _postprocess_default(items: list) -> list:
+    """Keep the 50 most recent items, newest first."""
+    return heapq.nlargest(50, items, key=lambda x: x['pubDate'])
+
+
+def _postprocess_gaming(items: list) -> list:
+    """Like :func:`_postprocess_default`, but only for items with a title,
+    link and image, and with Steam entries listed first."""
+    items = [it for it in items if it.get('title') and it.get('link') and it.get('image')]
+    return heapq.nlargest(
+        50, items, key=lambda x: (x['source'] == 'store.steampowered.com', x['pubDate'])
+    )
+
+
+# Category-specific filtering and ordering of the aggregated items. Categories
+# without an entry use ``_postprocess_default``.
+POSTPROCESSORS = {
+    'Gaming': _postprocess_gaming,
+}
+
+
+def main() -> None:
     feeds_path = os.path.join(os.path.dirname(__file__), 'feeds.json')
     data_dir = os.path.join(os.path.dirname(__file__), 'data')
     os.makedirs(data_dir, exist_ok=True)
     output_path = os.path.join(data_dir, 'news.json')
+    cache_path = os.path.join(data_dir, '.feed_cache.pickle')
 
     with open(feeds_path, 'r', encoding='utf-8') as f:
         feeds = json.load(f)
 
-    aggregated = {}
+    aggregated: dict = {}
+    # Fingerprints of every headline kept so far, across all categories
     global_titles = set()
-    today = datetime.datetime.utcnow().date()
+    # pubDate values are ISO-8601 UTC strings, so an item is from today
+    # exactly when it starts with today's date
+    today_prefix = datetime.datetime.utcnow().strftime('%Y-%m-%d')
+
+    feed_urls = [url for urls in feeds.values() for url in urls]
+    cache = load_feed_cache(cache_path)
+    results = fetch_all(feed_urls, cache)
+    # Drop entries for feeds no longer listed in feeds.json
+    save_feed_cache({url: cache[url] for url in feed_urls if url in cache}, cache_path)
 
     for category, urls in feeds.items():
         aggregated[category] = []
-        # Fetch all feeds for this category in parallel
-        with concurrent.futures.ThreadPoolExecutor(max_workers=len(urls) or 1) as executor:
-            futures = [executor.submit(fetch_feed, url) for url in urls]
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    items = future.result()
-                except Exception:
-                    items = []
-                for item in items:
-                    # Deduplicate by title across all categories
-                    title_key = item['title'].strip().lower()
-                    pub_date = datetime.datetime.fromisoformat(
-                        item['pubDate'].replace('Z', '+00:00')
-                    ).date()
-                    if pub_date != today or title_key in global_titles:
-                        continue
-                    global_titles.add(title_key)
-                    aggregated[category].append(item)
-        # For gaming news, enforce presence of title, link and image
-        if category == 'Gaming':
-            aggregated[category] = [
-                it for it in aggregated[category]
-                if it.get('title') and it.get('link') and it.get('image')
-            ]
-        # Sort items by publication date descending
-        aggregated[category].sort(key=lambda x: x['pubDate'], reverse=True)
-        if category == 'Gaming':
-            # Stable sort to prioritize Steam entries
-            aggregated[category].sort(key=lambda x: x['source'] != 'store.steampowered.com')
-        # Keep top 50 items
-        aggregated[category] = aggregated[category][:50]
+        for url in urls:
+            for item in results.get(url, []):
+                if not item['pubDate'].startswith(today_prefix):
+                    continue
+                # Deduplicate by title across all categories
+                title_key = _title_fingerprint(item['title'])
+                if title_key in global_titles:
+                    continue
+                global_titles.add(title_key)
+                aggregated[category].append(item)
+        aggregated[category] = POSTPROCESSORS.get(category, _postprocess_default)(aggregated[category])
 
     result = {
         'lastUpdate': datetime.datetime.utcnow().isoformat() + 'Z',
         'news': aggregated
     }
 
-    with open(output_path, 'w', encoding='utf-8') as out:
-        json.dump(result, out, ensure_ascii=False, indent=2)
+    write_json(result, output_path)
 
 
 if __name__ == '__main__':